@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Precompile .env into _env_cache.py
+
+config.py imports the generated module instead of re-parsing .env on every
+start, as long as it is at least as new as .env. Re-run this script after
+editing .env.
+"""
+
+import pprint
+from pathlib import Path
+
+from dotenv import dotenv_values
+
+ROOT = Path(__file__).resolve().parent
+
+def build_env_cache(dotenv_path: Path = ROOT / ".env", cache_path: Path = ROOT / "_env_cache.py") -> Path:
+    """
+    Write the values from a .env file to a Python module as a literal dict
+    
+    Args:
+        dotenv_path: Path to the .env file
+        cache_path: Path to the generated module
+        
+    Returns:
+        Path to the generated module
+    """
+    # Keys without a value are skipped, as load_dotenv() does
+    values = {key: value for key, value in dotenv_values(dotenv_path).items() if value is not None}
+    
+    cache_path.write_text(
+        '"""Generated by _build_env_cache.py from .env - do not edit"""\n\n'
+        f"ENV = {pprint.pformat(values)}\n",
+        encoding="utf-8"
+    )
+    return cache_path
+
+if __name__ == "__main__":
+    print(f"Environment cache written to: {build_env_cache()}")
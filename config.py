@@ -1,117 +1,183 @@
-"""
-Configuration settings for Pension Fund Performance Analytics Platform
-"""
-import os
-from typing import Dict, Any
-from dataclasses import dataclass
-from dotenv import load_dotenv
-
-load_dotenv()
-
-@dataclass
-class DatabaseConfig:
-    """Database configuration settings"""
-    host: str = os.getenv("DB_HOST", "localhost")
-    port: int = int(os.getenv("DB_PORT", "5432"))
-    database: str = os.getenv("DB_NAME", "pension_fund_analytics")
-    username: str = os.getenv("DB_USER", "postgres")
-    password: str = os.getenv("DB_PASSWORD", "")
-    pool_size: int = int(os.getenv("DB_POOL_SIZE", "10"))
-    max_overflow: int = int(os.getenv("DB_MAX_OVERFLOW", "20"))
-
-@dataclass
-class APIConfig:
-    """API configuration settings"""
-    host: str = os.getenv("API_HOST", "0.0.0.0")
-    port: int = int(os.getenv("API_PORT", "8000"))
-    debug: bool = os.getenv("API_DEBUG", "False").lower() == "true"
-    title: str = "Pension Fund Analytics API"
-    version: str = "1.0.0"
-    description: str = "REST API for Pension Fund Performance Analytics"
-    
-    # Security
-    secret_key: str = os.getenv("SECRET_KEY", "your-secret-key-change-in-production")
-    algorithm: str = "HS256"
-    access_token_expire_minutes: int = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
-    
-    # Rate limiting
-    rate_limit_per_minute: int = int(os.getenv("RATE_LIMIT_PER_MINUTE", "100"))
-
-@dataclass
-class AnalyticsConfig:
-    """Analytics and ML configuration settings"""
-    # Risk metrics
-    risk_free_rate: float = float(os.getenv("RISK_FREE_RATE", "0.02"))
-    market_return: float = float(os.getenv("MARKET_RETURN", "0.08"))
-    
-    # Anomaly detection
-    anomaly_contamination: float = float(os.getenv("ANOMALY_CONTAMINATION", "0.1"))
-    anomaly_random_state: int = int(os.getenv("ANOMALY_RANDOM_STATE", "42"))
-    
-    # Performance calculation
-    rolling_window_days: int = int(os.getenv("ROLLING_WINDOW_DAYS", "252"))
-    sharpe_ratio_risk_free_rate: float = float(os.getenv("SHARPE_RATIO_RISK_FREE_RATE", "0.02"))
-    
-    # Asset allocation
-    max_allocation_per_asset: float = float(os.getenv("MAX_ALLOCATION_PER_ASSET", "0.25"))
-    min_allocation_per_asset: float = float(os.getenv("MIN_ALLOCATION_PER_ASSET", "0.05"))
-
-@dataclass
-class ETLConfig:
-    """ETL pipeline configuration settings"""
-    data_source_url: str = os.getenv("DATA_SOURCE_URL", "")
-    data_refresh_interval_hours: int = int(os.getenv("DATA_REFRESH_INTERVAL_HOURS", "24"))
-    batch_size: int = int(os.getenv("BATCH_SIZE", "1000"))
-    
-    # File paths
-    data_directory: str = os.getenv("DATA_DIRECTORY", "data")
-    processed_data_path: str = os.getenv("PROCESSED_DATA_PATH", "data/processed")
-    raw_data_path: str = os.getenv("RAW_DATA_PATH", "data/raw")
-
-@dataclass
-class DashboardConfig:
-    """Dashboard configuration settings"""
-    refresh_interval_seconds: int = int(os.getenv("DASHBOARD_REFRESH_INTERVAL", "300"))
-    max_data_points: int = int(os.getenv("MAX_DATA_POINTS", "1000"))
-    
-    # Power BI settings
-    powerbi_workspace_id: str = os.getenv("POWERBI_WORKSPACE_ID", "")
-    powerbi_client_id: str = os.getenv("POWERBI_CLIENT_ID", "")
-    powerbi_client_secret: str = os.getenv("POWERBI_CLIENT_SECRET", "")
-
-@dataclass
-class LoggingConfig:
-    """Logging configuration settings"""
-    level: str = os.getenv("LOG_LEVEL", "INFO")
-    format: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    file_path: str = os.getenv("LOG_FILE_PATH", "logs/app.log")
-    max_file_size_mb: int = int(os.getenv("LOG_MAX_FILE_SIZE_MB", "10"))
-    backup_count: int = int(os.getenv("LOG_BACKUP_COUNT", "5"))
-
-class Config:
-    """Main configuration class"""
-    def __init__(self):
-        self.database = DatabaseConfig()
-        self.api = APIConfig()
-        self.analytics = AnalyticsConfig()
-        self.etl = ETLConfig()
-        self.dashboard = DashboardConfig()
-        self.logging = LoggingConfig()
-    
-    def get_database_url(self) -> str:
-        """Generate database URL for SQLAlchemy"""
-        return f"postgresql://{self.database.username}:{self.database.password}@{self.database.host}:{self.database.port}/{self.database.database}"
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert config to dictionary for API responses"""
-        return {
-            "database": self.database.__dict__,
-            "api": self.api.__dict__,
-            "analytics": self.analytics.__dict__,
-            "etl": self.etl.__dict__,
-            "dashboard": self.dashboard.__dict__,
-            "logging": self.logging.__dict__
-        }
-
-# Global config instance
+"""
+Configuration settings for Pension Fund Performance Analytics Platform
+"""
+import importlib.util
+import os
+import sys
+from functools import cached_property
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
+from dataclasses import dataclass, asdict
+
+_ROOT = Path(__file__).resolve().parent
+_DOTENV_PATH = _ROOT / ".env"
+_ENV_CACHE_PATH = _ROOT / "_env_cache.py"
+
+def _load_env_cache() -> Optional[Dict[str, str]]:
+    """Return the values precompiled by _build_env_cache.py, or None if missing or older than .env"""
+    try:
+        if _ENV_CACHE_PATH.stat().st_mtime < _DOTENV_PATH.stat().st_mtime:
+            return None
+        # Load the file that was just checked, not whatever _env_cache is first on sys.path
+        spec = importlib.util.spec_from_file_location("_env_cache", _ENV_CACHE_PATH)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module.ENV
+    except (OSError, ImportError, AttributeError):
+        return None
+
+_dotenv_values = _load_env_cache()
+if _dotenv_values is None:
+    from dotenv import load_dotenv
+    load_dotenv()
+else:
+    # Same precedence as load_dotenv(): real environment variables win
+    for _key, _value in _dotenv_values.items():
+        os.environ.setdefault(_key, _value)
+
+# Snapshot the environment once at import; every config default reads from it
+_ENV = os.environ.copy()
+
+def _get(key: str, default: str, cast=str):
+    """Look up an environment setting from the import-time snapshot"""
+    return cast(_ENV.get(key, default))
+
+# Sections carry no per-instance __dict__ where dataclasses support slots (3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(frozen=True, **_SLOTS)
+class DatabaseConfig:
+    """Database configuration settings"""
+    host: str = _get("DB_HOST", "localhost")
+    port: int = _get("DB_PORT", "5432", int)
+    database: str = _get("DB_NAME", "pension_fund_analytics")
+    username: str = _get("DB_USER", "postgres")
+    password: str = _get("DB_PASSWORD", "")
+    pool_size: int = _get("DB_POOL_SIZE", "10", int)
+    max_overflow: int = _get("DB_MAX_OVERFLOW", "20", int)
+
+@dataclass(frozen=True, **_SLOTS)
+class APIConfig:
+    """API configuration settings"""
+    host: str = _get("API_HOST", "0.0.0.0")
+    port: int = _get("API_PORT", "8000", int)
+    debug: bool = _get("API_DEBUG", "False").lower() == "true"
+    workers: int = _get("API_WORKERS", str(os.cpu_count() or 1), int)
+    title: str = "Pension Fund Analytics API"
+    version: str = "1.0.0"
+    description: str = "REST API for Pension Fund Performance Analytics"
+    
+    # Security
+    secret_key: str = _get("SECRET_KEY", "your-secret-key-change-in-production")
+    algorithm: str = "HS256"
+    access_token_expire_minutes: int = _get("ACCESS_TOKEN_EXPIRE_MINUTES", "30", int)
+    
+    # Rate limiting
+    rate_limit_per_minute: int = _get("RATE_LIMIT_PER_MINUTE", "100", int)
+
+@dataclass(frozen=True, **_SLOTS)
+class AnalyticsConfig:
+    """Analytics and ML configuration settings"""
+    # Risk metrics
+    risk_free_rate: float = _get("RISK_FREE_RATE", "0.02", float)
+    market_return: float = _get("MARKET_RETURN", "0.08", float)
+    
+    # Anomaly detection
+    anomaly_contamination: float = _get("ANOMALY_CONTAMINATION", "0.1", float)
+    anomaly_random_state: int = _get("ANOMALY_RANDOM_STATE", "42", int)
+    
+    # Performance calculation
+    rolling_window_days: int = _get("ROLLING_WINDOW_DAYS", "252", int)
+    sharpe_ratio_risk_free_rate: float = _get("SHARPE_RATIO_RISK_FREE_RATE", "0.02", float)
+    
+    # Asset allocation
+    max_allocation_per_asset: float = _get("MAX_ALLOCATION_PER_ASSET", "0.25", float)
+    min_allocation_per_asset: float = _get("MIN_ALLOCATION_PER_ASSET", "0.05", float)
+
+@dataclass(frozen=True, **_SLOTS)
+class ETLConfig:
+    """ETL pipeline configuration settings"""
+    data_source_url: str = _get("DATA_SOURCE_URL", "")
+    data_refresh_interval_hours: int = _get("DATA_REFRESH_INTERVAL_HOURS", "24", int)
+    batch_size: int = _get("BATCH_SIZE", "1000", int)
+    
+    # File paths
+    data_directory: str = _get("DATA_DIRECTORY", "data")
+    processed_data_path: str = _get("PROCESSED_DATA_PATH", "data/processed")
+    raw_data_path: str = _get("RAW_DATA_PATH", "data/raw")
+
+@dataclass(frozen=True, **_SLOTS)
+class DashboardConfig:
+    """Dashboard configuration settings"""
+    refresh_interval_seconds: int = _get("DASHBOARD_REFRESH_INTERVAL", "300", int)
+    max_data_points: int = _get("MAX_DATA_POINTS", "1000", int)
+    
+    # Power BI settings
+    powerbi_workspace_id: str = _get("POWERBI_WORKSPACE_ID", "")
+    powerbi_client_id: str = _get("POWERBI_CLIENT_ID", "")
+    powerbi_client_secret: str = _get("POWERBI_CLIENT_SECRET", "")
+
+@dataclass(frozen=True, **_SLOTS)
+class LoggingConfig:
+    """Logging configuration settings"""
+    level: str = _get("LOG_LEVEL", "INFO")
+    format: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    file_path: str = _get("LOG_FILE_PATH", "logs/app.log")
+    max_file_size_mb: int = _get("LOG_MAX_FILE_SIZE_MB", "10", int)
+    backup_count: int = _get("LOG_BACKUP_COUNT", "5", int)
+
+class Config:
+    """Main configuration class
+
+    Sections are built on first access, so tools that only read one
+    section never construct the others.
+    """
+    _cached_dict: Optional[Mapping[str, Mapping[str, Any]]] = None
+    
+    @cached_property
+    def database(self) -> DatabaseConfig:
+        return DatabaseConfig()
+    
+    @cached_property
+    def api(self) -> APIConfig:
+        return APIConfig()
+    
+    @cached_property
+    def analytics(self) -> AnalyticsConfig:
+        return AnalyticsConfig()
+    
+    @cached_property
+    def etl(self) -> ETLConfig:
+        return ETLConfig()
+    
+    @cached_property
+    def dashboard(self) -> DashboardConfig:
+        return DashboardConfig()
+    
+    @cached_property
+    def logging(self) -> LoggingConfig:
+        return LoggingConfig()
+    
+    def get_database_url(self) -> str:
+        """Generate database URL for SQLAlchemy"""
+        return f"postgresql://{self.database.username}:{self.database.password}@{self.database.host}:{self.database.port}/{self.database.database}"
+    
+    def to_dict(self) -> Mapping[str, Mapping[str, Any]]:
+        """Convert config to a read-only mapping for API responses
+
+        Sections are frozen, so the mapping is built once and reused.
+        """
+        if self._cached_dict is None:
+            self._cached_dict = MappingProxyType({
+                "database": MappingProxyType(asdict(self.database)),
+                "api": MappingProxyType(asdict(self.api)),
+                "analytics": MappingProxyType(asdict(self.analytics)),
+                "etl": MappingProxyType(asdict(self.etl)),
+                "dashboard": MappingProxyType(asdict(self.dashboard)),
+                "logging": MappingProxyType(asdict(self.logging))
+            })
+        return self._cached_dict
+
+# Global config instance
 config = Config() 
\ No newline at end of file
@@ -7,6 +7,7 @@ the platform's capabilities.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import time
 from datetime import datetime
@@ -17,20 +18,24 @@ BASE_URL = "http://localhost:8000"
 # Demo token (in production, this would be a real authentication token)
 DEMO_TOKEN = "demo-token-123"
 
+# Shared session so every demo call reuses one keep-alive connection
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=10, pool_maxsize=10))
+SESSION.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=10))
+SESSION.headers.update({
+    "Authorization": f"Bearer {DEMO_TOKEN}",
+    "Content-Type": "application/json"
+})
+
 def make_request(endpoint, params=None, method="GET"):
     """Make a request to the API with authentication"""
-    headers = {
-        "Authorization": f"Bearer {DEMO_TOKEN}",
-        "Content-Type": "application/json"
-    }
-    
     url = f"{BASE_URL}{endpoint}"
     
     try:
         if method == "GET":
-            response = requests.get(url, headers=headers, params=params)
+            response = SESSION.get(url, params=params)
         elif method == "POST":
-            response = requests.post(url, headers=headers, json=params)
+            response = SESSION.post(url, json=params)
         
         if response.status_code == 200:
             return response.json()
@@ -0,0 +1,54 @@
+"""
+Numba-compiled metric kernels for the ETL pipeline
+
+Kept in their own module so numba is only imported (and the kernels only
+compiled) when etl.pipeline actually uses them.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+# fastmath without the nnan/ninf flags: the kernels must still propagate NaN
+_FASTMATH_FLAGS = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
+
+# error_model='numpy': division by zero gives inf/NaN, as in pandas and NumPy,
+# instead of raising ZeroDivisionError (e.g. a flat price gives zero volatility)
+@njit(cache=True, parallel=True, fastmath=_FASTMATH_FLAGS, error_model='numpy')
+def metrics_kernel(close, window, risk_free_rate_daily):
+    """Compiled equivalent of the NumPy path in etl.pipeline._compute_symbol_metrics"""
+    n = close.shape[0]
+    daily_return = np.empty(n)
+    cumulative_return = np.empty(n)
+    rolling_volatility = np.full(n, np.nan)
+    sharpe_ratio = np.empty(n)
+    peak = np.empty(n)
+    drawdown = np.empty(n)
+    
+    daily_return[0] = np.nan
+    cumulative_return[0] = np.nan
+    running_peak = close[0]
+    for i in range(n):
+        if i > 0:
+            daily_return[i] = close[i] / close[i - 1] - 1
+            cumulative_return[i] = close[i] / close[0] - 1
+        # Skip missing prices when tracking the peak, like an expanding max
+        if close[i] > running_peak or np.isnan(running_peak):
+            running_peak = close[i]
+        peak[i] = running_peak
+        drawdown[i] = close[i] / running_peak - 1
+    
+    # Windows are independent, so the O(window) mean/variance per row runs in parallel
+    for i in prange(window - 1, n):
+        total = 0.0
+        for j in range(i - window + 1, i + 1):
+            total += daily_return[j]
+        mean = total / window
+        squares = 0.0
+        for j in range(i - window + 1, i + 1):
+            squares += (daily_return[j] - mean) ** 2
+        rolling_volatility[i] = np.sqrt(squares / (window - 1))
+    
+    for i in range(n):
+        sharpe_ratio[i] = (daily_return[i] - risk_free_rate_daily) / rolling_volatility[i]
+    
+    return daily_return, cumulative_return, rolling_volatility, sharpe_ratio, peak, drawdown
@@ -0,0 +1,52 @@
+"""
+Logging setup for Pension Fund Performance Analytics Platform
+
+Shared by the command-line entry points and the ETL pipeline, so the root
+logger is configured in exactly one place.
+"""
+
+import logging
+from pathlib import Path
+
+_logging_configured = False
+
+def setup_logging():
+    """Setup logging configuration (only the first call has any effect)
+
+    Records are queued and written by a background listener thread, with
+    file writes batched, so hot loops such as ETL extraction never wait on disk.
+    """
+    global _logging_configured
+    if _logging_configured:
+        return
+    
+    # Imported here so CLI commands that never log skip loading them
+    import atexit
+    import logging.handlers
+    import queue
+    from config import config as global_config
+    
+    log_path = Path(global_config.logging.file_path)
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(
+        log_queue,
+        logging.handlers.MemoryHandler(
+            capacity=1024,
+            flushLevel=logging.ERROR,
+            # delay=True: the log file is only opened on the first record
+            target=logging.FileHandler(log_path, delay=True)
+        ),
+        logging.StreamHandler()
+    )
+    listener.start()
+    atexit.register(listener.stop)
+    
+    logging.basicConfig(
+        level=getattr(logging, global_config.logging.level),
+        format=global_config.logging.format,
+        handlers=[logging.handlers.QueueHandler(log_queue)],
+        force=True
+    )
+    _logging_configured = True
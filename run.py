@@ -6,29 +6,43 @@ This script provides a command-line interface to run different components
 of the platform including ETL pipeline, API server, and tests.
 """
 
-import argparse
+import hashlib
+import importlib
+import importlib.util
+import json
 import sys
 import os
-import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-# Add current directory to path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
-from config import config as global_config
-from etl.pipeline import PensionFundETL
-from analytics.risk_metrics import PensionFundAnalytics
-
-def setup_logging():
-    """Setup logging configuration"""
-    logging.basicConfig(
-        level=getattr(logging, global_config.logging.level),
-        format=global_config.logging.format,
-        handlers=[
-            logging.FileHandler(global_config.logging.file_path),
-            logging.StreamHandler()
-        ]
-    )
+# Add the project root to path
+ROOT = Path(__file__).resolve().parent
+sys.path.insert(0, str(ROOT))
+
+from logging_setup import setup_logging
+
+# Heavy attributes resolved on first access (PEP 562) rather than at import
+_LAZY = {
+    "global_config": ("config", "config"),
+    "PensionFundETL": ("etl.pipeline", "PensionFundETL"),
+    "PensionFundAnalytics": ("analytics.risk_metrics", "PensionFundAnalytics"),
+}
+
+def __getattr__(name):
+    """Import and cache a lazy attribute the first time it is accessed"""
+    if name in _LAZY:
+        module_name, attr = _LAZY[name]
+        value = getattr(importlib.import_module(module_name), attr)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Set PFAP_EAGER_IMPORT=1 (e.g. in CI) to surface errors in deferred imports at startup
+if os.environ.get("PFAP_EAGER_IMPORT"):
+    for _name in _LAZY:
+        __getattr__(_name)
 
 def run_etl():
     """Run the ETL pipeline"""
@@ -36,6 +50,9 @@ def run_etl():
     setup_logging()
     
     try:
+        # Imported here so commands that don't need the ETL skip loading pandas/yfinance
+        from etl.pipeline import PensionFundETL
+        
         etl = PensionFundETL()
         result = etl.run_pipeline(use_sample_data=True)
         
@@ -54,19 +71,33 @@ def run_api():
     """Start the FastAPI server"""
     print("Starting API Server...")
     
+    from config import config as global_config
+    
     try:
+        # uvicorn imports "api.app:app" itself, in the worker process(es)
         import uvicorn
-        from api.app import app
         
         print(f"API will be available at: http://{global_config.api.host}:{global_config.api.port}")
         print(f"API documentation at: http://{global_config.api.host}:{global_config.api.port}/docs")
         print("Press Ctrl+C to stop the server")
         
+        # Pick the fast event loop and HTTP parser up front when installed,
+        # instead of leaving uvicorn to probe for them at startup
+        loop = "uvloop" if importlib.util.find_spec("uvloop") is not None else "asyncio"
+        http = "httptools" if importlib.util.find_spec("httptools") is not None else "h11"
+        
+        # The reloader runs a single worker process
+        reload = global_config.api.debug
+        workers = None if reload else global_config.api.workers
+        
         uvicorn.run(
             "api.app:app",
             host=global_config.api.host,
             port=global_config.api.port,
-            reload=global_config.api.debug,
+            reload=reload,
+            workers=workers,
+            loop=loop,
+            http=http,
             log_level=global_config.logging.level.lower()
         )
         
@@ -86,8 +117,14 @@ def run_tests():
         import pytest
         
         # Run tests
-        test_dir = Path(__file__).parent / "tests"
-        result = pytest.main([str(test_dir), "-v"])
+        test_dir = ROOT / "tests"
+        args = [str(test_dir), "--import-mode=importlib", "-p", "no:cacheprovider", "-q", "-x"]
+        
+        # Spread tests across cores when pytest-xdist is installed
+        if importlib.util.find_spec("xdist") is not None:
+            args += ["-n", "auto"]
+        
+        result = pytest.main(args)
         
         if result == 0:
             print("[SUCCESS] All tests passed!")
@@ -107,22 +144,34 @@ def run_analytics():
     print("[ANALYTICS] Running Analytics...")
     setup_logging()
     
+    # Imported inside the workers, so loading the ETL and the analytics stack
+    # (sklearn/scipy) overlap too, and other commands skip them entirely
+    def prepare_data():
+        from etl.pipeline import PensionFundETL
+        return PensionFundETL().run_pipeline(use_sample_data=True)
+    
+    def create_analytics():
+        from analytics.risk_metrics import PensionFundAnalytics
+        return PensionFundAnalytics()
+    
     try:
-        # Run ETL to get data
-        etl = PensionFundETL()
-        filepath = etl.run_pipeline(use_sample_data=True)
+        # Run ETL to get data while the analytics engine is loaded and constructed alongside it
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            etl_future = executor.submit(prepare_data)
+            analytics_future = executor.submit(create_analytics)
+            filepath = etl_future.result()
+            analytics = analytics_future.result()
         
         if not filepath or not os.path.exists(filepath):
             print("[ERROR] No data available for analytics")
             sys.exit(1)
         
-        # Load data
+        # Load data; Parquet stores Date as a timestamp, so no separate
+        # to_datetime pass over the column is needed
         import pandas as pd
-        df = pd.read_csv(filepath)
-        df['Date'] = pd.to_datetime(df['Date'])
+        df = pd.read_parquet(filepath, engine="pyarrow")
         
         # Run analytics
-        analytics = PensionFundAnalytics()
         report = analytics.generate_performance_report(df)
         
         print("[SUCCESS] Analytics completed!")
@@ -141,23 +190,84 @@ def run_analytics():
         print(f"[ERROR] Analytics error: {str(e)}")
         sys.exit(1)
 
-def check_dependencies():
+# Package name -> top-level module name
+REQUIRED_PACKAGES = {
+    'pandas': 'pandas', 'numpy': 'numpy', 'scipy': 'scipy', 'scikit-learn': 'sklearn',
+    'fastapi': 'fastapi', 'uvicorn': 'uvicorn', 'pydantic': 'pydantic',
+    'yfinance': 'yfinance', 'pyarrow': 'pyarrow', 'plotly': 'plotly', 'matplotlib': 'matplotlib'
+}
+
+# Dependency check results are reused across runs of the same interpreter
+DEPS_CACHE_PATH = Path.home() / ".cache" / "pfap" / "deps.json"
+DEPS_CACHE_TTL_SECONDS = 6 * 60 * 60
+
+def _deps_cache_key():
+    """Identify the interpreter and import path the cached results apply to"""
+    fingerprint = f"{sys.executable}\0{sys.version}\0{sys.path!r}"
+    return hashlib.blake2b(fingerprint.encode(), digest_size=16).hexdigest()
+
+def _scan_dependencies():
+    """Return {package: installed} for REQUIRED_PACKAGES"""
+    # find_spec locates the module without executing it, unlike importing
+    return {
+        package: importlib.util.find_spec(module) is not None
+        for package, module in REQUIRED_PACKAGES.items()
+    }
+
+def _read_deps_cache(key):
+    """Return the cached check for this interpreter, or None"""
+    try:
+        cached = json.loads(DEPS_CACHE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    
+    # Anything but a well-formed entry for this interpreter counts as a miss
+    if (
+        not isinstance(cached, dict)
+        or cached.get("key") != key
+        or not isinstance(cached.get("checked_at"), (int, float))
+        or not isinstance(cached.get("status"), dict)
+        or set(cached["status"]) != set(REQUIRED_PACKAGES)
+    ):
+        return None
+    return cached
+
+def _write_deps_cache(key, status):
+    """Atomically store a dependency check; failures only cost the next run a rescan"""
+    try:
+        DEPS_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = DEPS_CACHE_PATH.with_name(f"{DEPS_CACHE_PATH.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps({"key": key, "checked_at": time.time(), "status": status}), encoding="utf-8")
+        os.replace(tmp_path, DEPS_CACHE_PATH)
+    except OSError:
+        pass
+
+def check_dependencies(force=False):
     """Check if all required dependencies are installed"""
     print("[CHECK] Checking Dependencies...")
     
-    required_packages = [
-        'pandas', 'numpy', 'scipy', 'scikit-learn',
-        'fastapi', 'uvicorn', 'pydantic',
-        'yfinance', 'plotly', 'matplotlib'
-    ]
+    key = _deps_cache_key()
+    cached = None if force else _read_deps_cache(key)
+    
+    # Only a passing check is served from cache, so a fix is picked up on the next run
+    if cached is not None and all(cached["status"].values()):
+        status = cached["status"]
+        if time.time() - cached["checked_at"] > DEPS_CACHE_TTL_SECONDS:
+            # Stale: answer from cache now and refresh it for the next run
+            threading.Thread(
+                target=lambda: _write_deps_cache(key, _scan_dependencies()),
+                name="deps-cache-refresh"
+            ).start()
+    else:
+        status = _scan_dependencies()
+        _write_deps_cache(key, status)
     
     missing_packages = []
     
-    for package in required_packages:
-        try:
-            __import__(package)
+    for package, installed in status.items():
+        if installed:
             print(f"[OK] {package}")
-        except ImportError:
+        else:
             print(f"[MISSING] {package}")
             missing_packages.append(package)
     
@@ -169,8 +279,12 @@ def check_dependencies():
         print("\n[SUCCESS] All dependencies are installed!")
         return True
 
-def main():
-    """Main function with command-line interface"""
+COMMANDS = ('etl', 'api', 'test', 'analytics', 'check')
+
+def build_parser():
+    """Build the command-line argument parser"""
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="Pension Fund Performance Analytics Platform",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -181,37 +295,58 @@ Examples:
   python run.py test         # Run tests
   python run.py analytics    # Run analytics on sample data
   python run.py check        # Check dependencies
+  python run.py check --force-check  # Check dependencies, ignoring cached results
+  python run.py etl --quiet  # Run ETL pipeline without the banner
         """
     )
     
     parser.add_argument(
         'command',
-        choices=['etl', 'api', 'test', 'analytics', 'check'],
+        choices=COMMANDS,
         help='Command to run'
     )
     
-    args = parser.parse_args()
+    parser.add_argument(
+        '--force-check',
+        action='store_true',
+        help='Ignore cached results when running check'
+    )
+    
+    parser.add_argument(
+        '--quiet',
+        action='store_true',
+        help='Do not print the banner'
+    )
+    
+    return parser
+
+def main():
+    """Main function with command-line interface"""
+    # Fast path: a bare command needs no parser
+    if len(sys.argv) == 2 and sys.argv[1] in COMMANDS:
+        command, force_check, quiet = sys.argv[1], False, False
+    else:
+        args = build_parser().parse_args()
+        command, force_check, quiet = args.command, args.force_check, args.quiet
     
     # Print banner
-    print("=" * 50)
-    print("= Pension Fund Performance Analytics Platform =")
-    print("=" * 50)
-    print()
+    if not quiet:
+        print("=" * 50)
+        print("= Pension Fund Performance Analytics Platform =")
+        print("=" * 50)
+        print()
     
     # Execute command
-    if args.command == 'etl':
+    if command == 'etl':
         run_etl()
-    elif args.command == 'api':
+    elif command == 'api':
         run_api()
-    elif args.command == 'test':
+    elif command == 'test':
         run_tests()
-    elif args.command == 'analytics':
+    elif command == 'analytics':
         run_analytics()
-    elif args.command == 'check':
-        check_dependencies()
-    else:
-        parser.print_help()
-        sys.exit(1)
+    elif command == 'check':
+        check_dependencies(force=force_check)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -4,39 +4,72 @@ Simple project structure test script
 This script verifies that all project files are created correctly
 """
 
+import importlib.util
 import os
+import posixpath
 import sys
 from pathlib import Path
 
-def test_project_structure():
+# Add the project root to path
+ROOT = Path(__file__).resolve().parent
+sys.path.insert(0, str(ROOT))
+
+# Expected files and directories
+EXPECTED = frozenset({
+    "README.md",
+    "requirements.txt",
+    "config.py",
+    "run.py",
+    "env_template.txt",
+    "etl/pipeline.py",
+    "analytics/risk_metrics.py",
+    "api/app.py",
+    "data/fund_returns.csv",
+    "tests/test_analytics.py",
+    "dashboard/README.md"
+})
+
+# (path, byte strings that must all appear in it, what they show)
+CONTENT_CHECKS = (
+    ("README.md", (b"Pension Fund Performance Analytics Platform",), "project title"),
+    ("requirements.txt", (b"yfinance", b"fastapi"), "key dependencies"),
+    ("config.py", (b"class Config:",), "configuration class"),
+)
+
+def list_files(paths):
+    """Return the subset of paths that are existing files, scanning each parent directory once
+
+    Paths are "/"-separated and relative to ROOT, on every platform.
+    """
+    paths = set(paths)
+    present = set()
+    for directory in {posixpath.dirname(path) for path in paths}:
+        try:
+            with os.scandir(ROOT / directory) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        present.add(f"{directory}/{entry.name}" if directory else entry.name)
+        except OSError:
+            continue
+    return present & paths
+
+def read_files(paths):
+    """Return {path: bytes} for the paths that are existing files, reading each once"""
+    return {path: (ROOT / path).read_bytes() for path in list_files(paths)}
+
+def test_project_structure(files=None):
     """Test that all required files and directories exist"""
     print("🔍 Testing Project Structure...")
     
-    # Expected files and directories
-    expected_structure = [
-        "README.md",
-        "requirements.txt", 
-        "config.py",
-        "run.py",
-        "env_template.txt",
-        "etl/pipeline.py",
-        "analytics/risk_metrics.py",
-        "api/app.py",
-        "data/fund_returns.csv",
-        "tests/test_analytics.py",
-        "dashboard/README.md"
-    ]
-    
-    missing_files = []
-    existing_files = []
+    # Only existence matters here, so don't read the files unless main() already has
+    present = list_files(EXPECTED) if files is None else set(files)
+    missing_files = sorted(EXPECTED - present)
+    existing_files = sorted(EXPECTED - set(missing_files))
     
-    for file_path in expected_structure:
-        if os.path.exists(file_path):
-            existing_files.append(file_path)
-            print(f"✅ {file_path}")
-        else:
-            missing_files.append(file_path)
-            print(f"❌ {file_path}")
+    for file_path in existing_files:
+        print(f"✅ {file_path}")
+    for file_path in missing_files:
+        print(f"❌ {file_path}")
     
     print(f"\n📊 Results:")
     print(f"✅ Found: {len(existing_files)} files")
@@ -49,36 +82,21 @@ def test_project_structure():
         print("\n🎉 All project files created successfully!")
         return True
 
-def test_file_contents():
+def test_file_contents(files=None):
     """Test that key files have expected content"""
     print("\n📄 Testing File Contents...")
     
-    # Test README.md
-    if os.path.exists("README.md"):
-        with open("README.md", "r", encoding="utf-8") as f:
-            content = f.read()
-            if "Pension Fund Performance Analytics Platform" in content:
-                print("✅ README.md - Contains project title")
-            else:
-                print("❌ README.md - Missing project title")
-    
-    # Test requirements.txt
-    if os.path.exists("requirements.txt"):
-        with open("requirements.txt", "r", encoding="utf-8") as f:
-            content = f.read()
-            if "yfinance" in content and "fastapi" in content:
-                print("✅ requirements.txt - Contains key dependencies")
-            else:
-                print("❌ requirements.txt - Missing key dependencies")
+    # Search the raw bytes (no decode needed)
+    if files is None:
+        files = read_files([path for path, _, _ in CONTENT_CHECKS])
     
-    # Test config.py
-    if os.path.exists("config.py"):
-        with open("config.py", "r", encoding="utf-8") as f:
-            content = f.read()
-            if "class Config:" in content:
-                print("✅ config.py - Contains configuration class")
-            else:
-                print("❌ config.py - Missing configuration class")
+    for path, needles, label in CONTENT_CHECKS:
+        if path not in files:
+            continue
+        if all(needle in files[path] for needle in needles):
+            print(f"✅ {path} - Contains {label}")
+        else:
+            print(f"❌ {path} - Missing {label}")
 
 def test_imports():
     """Test that Python modules can be imported (without external deps)"""
@@ -86,23 +104,23 @@ def test_imports():
     
     try:
         # Test config import
-        sys.path.append(os.path.dirname(os.path.abspath(__file__)))
         from config import config
         print("✅ config.py - Can be imported")
     except Exception as e:
         print(f"❌ config.py - Import failed: {e}")
     
-    try:
-        # Test ETL import (will fail without yfinance, but that's expected)
-        from etl.pipeline import PensionFundETL
-        print("✅ etl/pipeline.py - Can be imported")
-    except ImportError as e:
-        if "yfinance" in str(e):
-            print("✅ etl/pipeline.py - Import structure correct (yfinance not installed)")
-        else:
+    # Test ETL import: by default only check the module resolves, without
+    # executing it (and pulling in pandas/numpy); set PFAP_FULL_SMOKE=1 to import it
+    if os.environ.get("PFAP_FULL_SMOKE") == "1":
+        try:
+            from etl.pipeline import PensionFundETL
+            print("✅ etl/pipeline.py - Can be imported")
+        except Exception as e:
             print(f"❌ etl/pipeline.py - Import failed: {e}")
-    except Exception as e:
-        print(f"❌ etl/pipeline.py - Unexpected error: {e}")
+    elif importlib.util.find_spec("etl.pipeline") is not None:
+        print("✅ etl/pipeline.py - Import structure correct")
+    else:
+        print("❌ etl/pipeline.py - Module not found")
     
     try:
         # Test analytics import
@@ -111,18 +129,20 @@ def test_imports():
     except Exception as e:
         print(f"❌ analytics/risk_metrics.py - Import failed: {e}")
 
-def test_data_files():
+def test_data_files(files=None):
     """Test that data files exist and have content"""
     print("\n📊 Testing Data Files...")
     
+    if files is None:
+        files = read_files(["data/fund_returns.csv"])
+    
     # Test sample data
-    if os.path.exists("data/fund_returns.csv"):
-        with open("data/fund_returns.csv", "r", encoding="utf-8") as f:
-            lines = f.readlines()
-            if len(lines) > 1:  # Has header + data
-                print(f"✅ data/fund_returns.csv - Contains {len(lines)} lines")
-            else:
-                print("❌ data/fund_returns.csv - Empty or missing data")
+    if "data/fund_returns.csv" in files:
+        lines = files["data/fund_returns.csv"].splitlines()
+        if len(lines) > 1:  # Has header + data
+            print(f"✅ data/fund_returns.csv - Contains {len(lines)} lines")
+        else:
+            print("❌ data/fund_returns.csv - Empty or missing data")
     else:
         print("❌ data/fund_returns.csv - File not found")
 
@@ -133,11 +153,14 @@ def main():
     print("🏦" * 50)
     print()
     
+    # Read every expected file once and share the contents between the checks
+    files = read_files(EXPECTED)
+    
     # Run all tests
-    structure_ok = test_project_structure()
-    test_file_contents()
+    structure_ok = test_project_structure(files)
+    test_file_contents(files)
     test_imports()
-    test_data_files()
+    test_data_files(files)
     
     print("\n" + "="*50)
     if structure_ok:
@@ -4,6 +4,7 @@ Tests for Pension Fund Analytics Module
 This module contains unit tests for the risk metrics and analytics functionality.
 """
 
+import functools
 import pytest
 import pandas as pd
 import numpy as np
@@ -17,50 +18,56 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from analytics.risk_metrics import PensionFundAnalytics
 from config import config
 
+@functools.lru_cache(maxsize=1)
+def _cached_analytics():
+    """Build one PensionFundAnalytics shared by every test in the process"""
+    return PensionFundAnalytics()
+
 class TestPensionFundAnalytics:
     """Test class for PensionFundAnalytics"""
     
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def analytics(self):
         """Create analytics instance for testing"""
-        return PensionFundAnalytics()
+        return _cached_analytics()
     
-    @pytest.fixture
-    def sample_data(self):
-        """Create sample fund data for testing"""
+    @pytest.fixture(scope="session")
+    def _sample_data(self):
+        """Generate sample fund data once for the whole test session"""
         dates = pd.date_range(start='2023-01-01', end='2023-12-31', freq='D')
         
         # Generate realistic fund data
-        np.random.seed(42)
+        rng = np.random.default_rng(42)
         
-        data = []
         symbols = ['VTI', 'VXUS', 'BND']
-        
-        for symbol in symbols:
-            # Generate price series
-            base_price = 100 if symbol == 'VTI' else (50 if symbol == 'VXUS' else 80)
-            returns = np.random.normal(0.0005, 0.015, len(dates))
-            prices = [base_price]
-            
-            for ret in returns[1:]:
-                new_price = prices[-1] * (1 + ret)
-                prices.append(max(new_price, 1))
-            
-            # Create DataFrame for this symbol
-            symbol_data = pd.DataFrame({
-                'Date': dates,
-                'Symbol': symbol,
-                'Open': prices,
-                'High': [p * (1 + abs(np.random.normal(0, 0.005))) for p in prices],
-                'Low': [p * (1 - abs(np.random.normal(0, 0.005))) for p in prices],
-                'Close': prices,
-                'Volume': np.random.randint(1000000, 10000000, len(dates)),
-                'Daily_Return': [0] + [prices[i]/prices[i-1] - 1 for i in range(1, len(prices))]
-            })
-            
-            data.append(symbol_data)
-        
-        return pd.concat(data, ignore_index=True)
+        base_prices = np.array([100, 50, 80])
+        shape = (len(symbols), len(dates))
+        
+        # Generate every symbol's price series at once, one row per symbol
+        returns = rng.normal(0.0005, 0.015, shape)
+        returns[:, 0] = 0.0
+        prices = np.maximum(base_prices[:, None] * np.cumprod(1.0 + returns, axis=1), 1.0)
+        
+        daily_returns = np.zeros(shape)
+        daily_returns[:, 1:] = prices[:, 1:] / prices[:, :-1] - 1.0
+        
+        # Build the long-format frame directly (one block of rows per symbol), no concat
+        return pd.DataFrame({
+            'Date': np.tile(dates, len(symbols)),
+            'Symbol': np.repeat(symbols, len(dates)),
+            'Open': prices.ravel(),
+            'High': (prices * (1 + np.abs(rng.normal(0, 0.005, shape)))).ravel(),
+            'Low': (prices * (1 - np.abs(rng.normal(0, 0.005, shape)))).ravel(),
+            'Close': prices.ravel(),
+            'Volume': rng.integers(1_000_000, 10_000_000, shape).ravel(),
+            'Daily_Return': daily_returns.ravel()
+        })
+    
+    @pytest.fixture
+    def sample_data(self, _sample_data):
+        """Create sample fund data for testing"""
+        # Copy so a test that mutates the frame can't affect later tests
+        return _sample_data.copy()
     
     def test_analytics_initialization(self, analytics):
         """Test analytics module initialization"""
@@ -0,0 +1,218 @@
+"""
+Tests for Pension Fund ETL Pipeline
+
+This module contains unit tests for the metric backends and the threaded
+extraction and partitioned loading in the ETL pipeline.
+"""
+
+import dataclasses
+import threading
+import time
+import types
+import pytest
+import pandas as pd
+import numpy as np
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from etl import pipeline
+
+# Symbols the stub yfinance fails on, returns nothing for, or answers slowly
+FAILING_SYMBOL = 'FAIL'
+EMPTY_SYMBOL = 'EMPTY'
+SLOW_SYMBOL = 'SLOW'
+
+WINDOW = 20
+RISK_FREE_RATE_DAILY = (1 + 0.02) ** (1/252) - 1
+
+def _pandas_reference(df, window, risk_free_rate_daily):
+    """Compute the metric columns with a plain pandas groupby, as the pipeline originally did"""
+    df = df.sort_values(['Symbol', 'Date'], kind='stable', ignore_index=True)
+    by_symbol = df.groupby('Symbol')
+    
+    df['Daily_Return'] = by_symbol['Close'].pct_change()
+    df['Cumulative_Return'] = (1 + df['Daily_Return']).groupby(df['Symbol']).cumprod() - 1
+    df['Rolling_Volatility'] = by_symbol['Daily_Return'].rolling(window).std().reset_index(0, drop=True)
+    df['Sharpe_Ratio'] = (df['Daily_Return'] - risk_free_rate_daily) / df['Rolling_Volatility']
+    df['Peak'] = by_symbol['Close'].expanding().max().reset_index(0, drop=True)
+    df['Drawdown'] = df['Close'] / df['Peak'] - 1
+    return df
+
+@pytest.fixture(scope="module")
+def raw_data():
+    """Generate shuffled multi-symbol price data, including a flat-priced fund"""
+    rng = np.random.default_rng(7)
+    dates = pd.bdate_range(start='2023-01-02', periods=120)
+    symbols = ['VTI', 'VXUS', 'BND', 'VMFXX']
+    
+    prices = 100 * np.cumprod(1 + rng.normal(0.0005, 0.01, (len(symbols), len(dates))), axis=1)
+    # A money-market fund held at 1.00 has zero returns, so zero rolling volatility
+    prices[3] = 1.0
+    
+    df = pd.DataFrame({
+        'Date': np.tile(dates, len(symbols)),
+        'Symbol': np.repeat(symbols, len(dates)),
+        'Close': prices.ravel()
+    })
+    # Rows arrive unordered; every backend has to sort them itself
+    return df.sample(frac=1, random_state=7).reset_index(drop=True)
+
+@pytest.fixture(scope="module")
+def expected(raw_data):
+    """Reference metrics from pandas"""
+    return _pandas_reference(raw_data, WINDOW, RISK_FREE_RATE_DAILY)
+
+class TestMetricBackends:
+    """Every metric backend must agree with the pandas reference"""
+    
+    def _assert_matches(self, result, expected):
+        result = result.sort_values(['Symbol', 'Date'], kind='stable', ignore_index=True)
+        assert list(result['Symbol']) == list(expected['Symbol'])
+        for column in pipeline.METRIC_COLUMNS:
+            np.testing.assert_allclose(
+                result[column].to_numpy(dtype=float),
+                expected[column].to_numpy(dtype=float),
+                rtol=1e-9, atol=1e-12, equal_nan=True, err_msg=column
+            )
+    
+    def test_numpy_backend(self, raw_data, expected):
+        """Test the pure NumPy kernel"""
+        result = pipeline._transform_with_numpy(raw_data, WINDOW, RISK_FREE_RATE_DAILY, use_numba=False)
+        self._assert_matches(result, expected)
+    
+    def test_numba_backend(self, raw_data, expected):
+        """Test the numba-compiled kernel"""
+        pytest.importorskip("numba")
+        assert pipeline._numba_kernel() is not None
+        result = pipeline._transform_with_numpy(raw_data, WINDOW, RISK_FREE_RATE_DAILY)
+        self._assert_matches(result, expected)
+    
+    def test_polars_backend(self, raw_data, expected):
+        """Test the Polars expressions"""
+        pytest.importorskip("polars")
+        result = pipeline._transform_with_polars(raw_data, WINDOW, RISK_FREE_RATE_DAILY)
+        self._assert_matches(result, expected)
+    
+    def test_old_polars_is_not_used(self, monkeypatch):
+        """Test that a Polars older than MIN_POLARS_VERSION is ignored"""
+        polars = pytest.importorskip("polars")
+        monkeypatch.setattr(polars, "__version__", "0.19.12")
+        assert pipeline._polars() is None
+    
+    def test_polars_failure_falls_back_to_numpy(self, monkeypatch, etl, raw_data, expected):
+        """Test that transform_fund_data still succeeds when the Polars path raises"""
+        def broken_polars_transform(*args):
+            raise AttributeError("polars too old")
+        
+        monkeypatch.setattr(pipeline, "_polars", lambda: object())
+        monkeypatch.setattr(pipeline, "_transform_with_polars", broken_polars_transform)
+        monkeypatch.setattr(pipeline.config, "analytics", dataclasses.replace(
+            pipeline.config.analytics, rolling_window_days=WINDOW, sharpe_ratio_risk_free_rate=0.02
+        ))
+        
+        result = etl.transform_fund_data(raw_data)
+        self._assert_matches(result, expected.dropna(subset=['Daily_Return']).reset_index(drop=True))
+    
+    def test_backends_not_imported_with_pipeline(self):
+        """Test that importing the pipeline does not import numba or polars"""
+        import subprocess
+        
+        code = (
+            "import sys; import etl.pipeline; "
+            "print(any(name in sys.modules for name in ('numba', 'polars')))"
+        )
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        output = subprocess.run(
+            [sys.executable, "-c", code], cwd=root, capture_output=True, text=True, check=True
+        ).stdout
+        assert output.strip() == "False"
+
+class _FakeTicker:
+    """Stand-in for yfinance.Ticker that never touches the network"""
+    
+    def __init__(self, symbol):
+        self.symbol = symbol
+    
+    def history(self, start, end):
+        if self.symbol == FAILING_SYMBOL:
+            raise RuntimeError("download failed")
+        if self.symbol == EMPTY_SYMBOL:
+            return pd.DataFrame()
+        if self.symbol == SLOW_SYMBOL:
+            time.sleep(0.2)
+        
+        dates = pd.bdate_range(start=start, end=end, name='Date')
+        close = 100 + np.arange(len(dates), dtype=float)
+        return pd.DataFrame({'Open': close, 'Close': close, 'Volume': 1000}, index=dates)
+
+@pytest.fixture
+def etl(monkeypatch, tmp_path):
+    """Create an ETL instance that writes under tmp_path and extracts from a stub yfinance"""
+    monkeypatch.setitem(sys.modules, 'yfinance', types.SimpleNamespace(Ticker=_FakeTicker))
+    monkeypatch.chdir(tmp_path)
+    
+    instance = pipeline.PensionFundETL()
+    instance.config = dataclasses.replace(instance.config, processed_data_path=str(tmp_path / "processed"))
+    return instance
+
+class TestExtractAndLoad:
+    """Test the threaded extraction and the partitioned dataset writer"""
+    
+    def test_failing_and_empty_symbols_are_skipped(self, etl):
+        """Test that symbols with errors or no data yield nothing"""
+        frames = list(etl.iter_fund_data(['VTI', FAILING_SYMBOL, EMPTY_SYMBOL, 'BND'], '2023-01-02', '2023-01-31'))
+        
+        assert sorted(frame['Symbol'].iat[0] for frame in frames) == ['BND', 'VTI']
+    
+    def test_extract_restores_symbol_order(self, etl):
+        """Test that frames are combined in the requested order, not completion order"""
+        symbols = [SLOW_SYMBOL, 'VTI', FAILING_SYMBOL, 'BND']
+        df = etl.extract_fund_data(symbols, '2023-01-02', '2023-01-31')
+        
+        assert list(df['Symbol'].unique()) == [SLOW_SYMBOL, 'VTI', 'BND']
+    
+    def test_extract_with_no_data(self, etl):
+        """Test that extraction with nothing downloaded returns an empty frame"""
+        df = etl.extract_fund_data([FAILING_SYMBOL, EMPTY_SYMBOL], '2023-01-02', '2023-01-31')
+        
+        assert df.empty
+    
+    def test_close_after_first_frame_releases_workers(self, etl):
+        """Test that stopping early leaves no worker blocked on the full queue"""
+        threads_before = set(threading.enumerate())
+        symbols = [f"SYM{i}" for i in range(pipeline.MAX_EXTRACT_WORKERS + 2 * pipeline.MAX_PENDING_FRAMES)]
+        
+        frames = etl.iter_fund_data(symbols, '2023-01-02', '2023-01-31')
+        assert not next(frames).empty
+        frames.close()
+        
+        for thread in set(threading.enumerate()) - threads_before:
+            thread.join(timeout=5)
+            assert not thread.is_alive()
+    
+    def test_load_dataset_round_trip(self, etl):
+        """Test that a partitioned dataset reads back with its metadata"""
+        frames = etl.iter_fund_data(['VTI', FAILING_SYMBOL, 'BND'], '2023-01-02', '2023-03-31')
+        dirpath = etl.load_fund_dataset(etl.transform_fund_data(frame) for frame in frames)
+        
+        assert dirpath
+        assert sorted(os.listdir(dirpath)) == ['Symbol=BND', 'Symbol=VTI']
+        
+        df = pd.read_parquet(dirpath)
+        assert sorted(df['Symbol'].astype(str).unique()) == ['BND', 'VTI']
+        assert len(df) == 2 * (len(pd.bdate_range('2023-01-02', '2023-03-31')) - 1)
+        assert set(pipeline.METRIC_COLUMNS) <= set(df.columns)
+        
+        metadata = pipeline.read_processing_metadata(dirpath)
+        assert metadata['data_source'] == pipeline.DATA_SOURCE
+        assert 'processed_at' in metadata
+    
+    def test_load_dataset_with_no_frames(self, etl):
+        """Test that an empty stream writes nothing"""
+        assert etl.load_fund_dataset(iter([])) == ""
+
+if __name__ == "__main__":
+    pytest.main([__file__])